@@ -14,19 +14,40 @@ Features:
 API Version: 1.0.0
 """
 
-import os
 import json
 import logging
 import time
 from datetime import date
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Tuple
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 
 from src.plugin_system.base_plugin import BasePlugin
 
+# Optional fast JSON parser; falls back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Plugin directory, resolved once at import time
+_PLUGIN_DIR = Path(__file__).resolve().parent
+
+
+@dataclass
+class LayoutPlan:
+    """Precomputed geometry for one screen (title + underline + text lines)."""
+    title: str
+    title_x: int
+    title_y: int
+    title_width: int
+    underline_y: int
+    lines: List[Tuple[str, int, int]] = field(default_factory=list)  # (text, x, y)
+    frame: Optional[Image.Image] = None  # Rendered frame, filled on first draw
+
 
 class OfTheDayPlugin(BasePlugin):
     """
@@ -59,18 +80,34 @@ class OfTheDayPlugin(BasePlugin):
         # State
         self.current_day = None
         self.current_items = {}
+        self._enabled_categories = ()
         self.current_category_index = 0
         self.rotation_state = 0  # 0 = title, 1 = content
         self.last_update = 0
-        self.last_rotation_time = time.time()
-        self.last_category_rotation_time = time.time()
+        # Absolute rotation deadlines on the monotonic clock
+        now = time.monotonic()
+        self._next_subtitle_deadline = now + self.subtitle_rotate_interval
+        self._next_category_deadline = now + self.display_rotate_interval
         
         # Display state tracking (to avoid unnecessary redraws)
         self.last_displayed_category = None
         self.last_displayed_rotation_state = None
         self.display_needs_update = True  # Force initial display
+        self._last_rendered_key = None  # (category_index, rotation_state, day) of the frame on screen
+        
+        # Cached fonts and metrics (loaded lazily on first display)
+        self._title_font = None
+        self._body_font = None
+        self._title_height = 8
+        self._body_height = 8
+        
+        # Memoized text widths keyed by (id(font), text)
+        self._text_width_cache = {}
         
-        # Data files
+        # Precomputed screen layouts keyed by (category_name, rotation_state)
+        self._layout_cache: Dict[Tuple[str, int], LayoutPlan] = {}
+        
+        # Data file paths per category
         self.data_files = {}
         
         # Colors
@@ -118,8 +155,48 @@ class OfTheDayPlugin(BasePlugin):
         except Exception as e:
             self.logger.warning(f"Error registering fonts: {e}")
     
+    def _ensure_fonts(self):
+        """Load title/body fonts and their heights once, reusing them across frames."""
+        if self._title_font is not None and self._body_font is not None:
+            return
+        
+        # Load fonts - match old manager font usage
+        try:
+            title_font = ImageFont.truetype('assets/fonts/PressStart2P-Regular.ttf', 8)
+        except Exception as e:
+            self.logger.warning(f"Failed to load PressStart2P font: {e}, using fallback")
+            title_font = self.display_manager.small_font if hasattr(self.display_manager, 'small_font') else ImageFont.load_default()
+        
+        try:
+            body_font = ImageFont.truetype('assets/fonts/4x6-font.ttf', 6)
+        except Exception as e:
+            self.logger.warning(f"Failed to load 4x6 font: {e}, using fallback")
+            body_font = self.display_manager.extra_small_font if hasattr(self.display_manager, 'extra_small_font') else ImageFont.load_default()
+        
+        # Get font heights
+        try:
+            title_height = self.display_manager.get_font_height(title_font)
+        except Exception as e:
+            self.logger.warning(f"Error getting title font height: {e}, using default 8")
+            title_height = 8
+        try:
+            body_height = self.display_manager.get_font_height(body_font)
+        except Exception as e:
+            self.logger.warning(f"Error getting body font height: {e}, using default 8")
+            body_height = 8
+        
+        self._title_font = title_font
+        self._body_font = body_font
+        self._title_height = title_height
+        self._body_height = body_height
+    
     def _load_data_files(self):
-        """Load all data files for enabled categories."""
+        """
+        Locate the data files for enabled categories.
+        
+        Only the paths are kept; entries are read per day in _load_todays_items
+        so the whole year is never held in memory.
+        """
         for category_name, category_config in self.categories.items():
             if not category_config.get('enabled', True):
                 self.logger.debug(f"Skipping disabled category: {category_name}")
@@ -137,36 +214,44 @@ class OfTheDayPlugin(BasePlugin):
                     self.logger.warning(f"Could not find data file: {data_file}")
                     continue
                 
-                # Load and parse JSON
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                self.data_files[category_name] = data
-                self.logger.info(f"Loaded data for category '{category_name}': {len(data)} entries")
+                self.data_files[category_name] = file_path
+                self.logger.info(f"Using data file for category '{category_name}': {file_path}")
                 
             except Exception as e:
                 self.logger.error(f"Error loading data file for {category_name}: {e}")
     
+    def _read_data_file(self, file_path: str) -> Dict[str, Any]:
+        """Parse a JSON data file, using orjson when available."""
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
     def _find_data_file(self, data_file: str) -> Optional[str]:
         """Find the data file in possible locations."""
-        # Get plugin directory
-        plugin_dir = os.path.dirname(os.path.abspath(__file__))
-        
         # Possible paths to check (prioritize plugin directory)
-        possible_paths = [
-            os.path.join(plugin_dir, data_file),  # In plugin directory (preferred)
-            data_file,  # Direct path (if absolute)
-            os.path.join(os.getcwd(), data_file),  # Relative to cwd (fallback)
-        ]
+        possible_paths = (
+            _PLUGIN_DIR / data_file,  # In plugin directory (preferred)
+            Path(data_file),  # Direct path (if absolute)
+            Path.cwd() / data_file,  # Relative to cwd (fallback)
+        )
         
         for path in possible_paths:
-            if os.path.exists(path):
+            if path.is_file():
                 self.logger.info(f"Found data file at: {path}")
-                return path
+                return str(path)
         
         self.logger.warning(f"Data file not found: {data_file}")
         return None
     
+    @staticmethod
+    def _day_of_year(d: date) -> int:
+        """Return the 1-based day of year using closed-form month arithmetic (no struct_time)."""
+        leap = d.year % 4 == 0 and (d.year % 100 != 0 or d.year % 400 == 0)
+        return (275 * d.month) // 9 - ((d.month + 9) // 12) * (1 if leap else 2) + d.day - 30
+    
     def _load_todays_items(self):
         """Load items for today's date from all enabled categories."""
         today = date.today()
@@ -176,31 +261,54 @@ class OfTheDayPlugin(BasePlugin):
         
         self.current_day = today
         self.current_items = {}
+        self._layout_cache = {}
         self.display_needs_update = True  # Force redraw when day changes
         
         # Calculate day of year (1-365, or 1-366 for leap years)
-        day_of_year = today.timetuple().tm_yday
+        day_of_year = self._day_of_year(today)
+        day_key = str(day_of_year)
         
-        for category_name, data in self.data_files.items():
+        for category_name, file_path in self.data_files.items():
             try:
-                # Find today's entry using day of year
-                day_key = str(day_of_year)
+                # Find today's entry using day of year; the rest of the year is dropped
+                entry = self._read_data_file(file_path).get(day_key)
                 
-                if day_key in data:
-                    self.current_items[category_name] = data[day_key]
-                    item_title = data[day_key].get('word', data[day_key].get('title', 'N/A'))
-                    self.logger.info(f"Loaded item for {category_name} (day {day_of_year}): {item_title}")
+                if entry is not None:
+                    item = self._normalize_entry(entry)
+                    self.current_items[category_name] = item
+                    self.logger.info(f"Loaded item for {category_name} (day {day_of_year}): {item['title']}")
                 else:
                     self.logger.warning(f"No entry found for day {day_of_year} in category {category_name}")
             
             except Exception as e:
                 self.logger.error(f"Error loading today's item for {category_name}: {e}")
+        
+        self._recompute_enabled()
+    
+    def _recompute_enabled(self):
+        """Cache the ordered tuple of enabled categories that have an item for today."""
+        self._enabled_categories = tuple(
+            cat for cat in self.category_order
+            if cat in self.current_items and self.categories.get(cat, {}).get('enabled', True)
+        )
+    
+    @staticmethod
+    def _normalize_entry(raw: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve field aliases once into a fixed {'title', 'subtitle', 'description'} dict."""
+        return {
+            # JSON uses "title" (older files use "word")
+            'title': raw.get('title', raw.get('word', 'N/A')),
+            # JSON uses "subtitle"
+            'subtitle': raw.get('subtitle', raw.get('pronunciation', raw.get('type', ''))),
+            # JSON uses "description"
+            'description': raw.get('description', raw.get('definition', raw.get('content', raw.get('text', 'No content')))),
+        }
     
     def update(self) -> None:
         """Update items if it's a new day."""
         current_time = time.time()
         
-        # Check if we need to update
+        # Check if we need to update (only query the date once per interval)
         if current_time - self.last_update < self.update_interval:
             return
         
@@ -225,11 +333,17 @@ class OfTheDayPlugin(BasePlugin):
                 self._display_no_data()
             return
         
+        # Frame-skip: nothing can change before the next rotation deadline, and the
+        # display still holds the last rendered frame
+        if (not force_clear and
+                not self.display_needs_update and
+                time.monotonic() < self.next_wake_time() and
+                self._last_rendered_key == (self.current_category_index, self.rotation_state, self.current_day)):
+            return
+        
         try:
-            # Get enabled categories in order
-            enabled_categories = [cat for cat in self.category_order 
-                                if cat in self.current_items and 
-                                self.categories.get(cat, {}).get('enabled', True)]
+            # Enabled categories in order (precomputed when items/config change)
+            enabled_categories = self._enabled_categories
             
             if not enabled_categories:
                 if self.last_displayed_category != "NO_DATA":
@@ -238,26 +352,25 @@ class OfTheDayPlugin(BasePlugin):
                 return
             
             # Rotate categories
-            current_time = time.time()
+            current_time = time.monotonic()
             category_changed = False
-            if current_time - self.last_category_rotation_time >= self.display_rotate_interval:
+            if current_time >= self._next_category_deadline:
                 self.current_category_index = (self.current_category_index + 1) % len(enabled_categories)
-                self.last_category_rotation_time = current_time
+                self._next_category_deadline = current_time + self.display_rotate_interval
                 self.rotation_state = 0  # Reset rotation when changing categories
-                self.last_rotation_time = current_time
+                self._next_subtitle_deadline = current_time + self.subtitle_rotate_interval
                 category_changed = True
                 self.display_needs_update = True
             
             # Get current category
             category_name = enabled_categories[self.current_category_index]
-            category_config = self.categories.get(category_name, {})
-            item_data = self.current_items.get(category_name, {})
+            item_data = self.current_items[category_name]
             
             # Rotate display content
             rotation_changed = False
-            if current_time - self.last_rotation_time >= self.subtitle_rotate_interval:
+            if current_time >= self._next_subtitle_deadline:
                 self.rotation_state = (self.rotation_state + 1) % 2
-                self.last_rotation_time = current_time
+                self._next_subtitle_deadline = current_time + self.subtitle_rotate_interval
                 rotation_changed = True
                 self.display_needs_update = True
             
@@ -277,16 +390,52 @@ class OfTheDayPlugin(BasePlugin):
                 
                 # Display based on rotation state
                 if self.rotation_state == 0:
-                    self._display_title(category_config, item_data)
+                    self._display_title(category_name, item_data)
                 else:
-                    self._display_content(category_config, item_data)
+                    self._display_content(category_name, item_data)
+                
+                self._last_rendered_key = (self.current_category_index, self.rotation_state, self.current_day)
         
         except Exception as e:
             self.logger.error(f"Error displaying of-the-day: {e}")
+            self._last_rendered_key = None
             if self.last_displayed_category != "ERROR":
                 self.last_displayed_category = "ERROR"
                 self._display_error()
     
+    def next_wake_time(self) -> float:
+        """Return the next rotation deadline (time.monotonic() clock) so callers can sleep until it."""
+        return min(self._next_subtitle_deadline, self._next_category_deadline)
+    
+    def _measure(self, text: str, font) -> int:
+        """Measure text width, preferring PIL's getlength over slower bbox-based paths."""
+        # PIL fonts (TTF and bitmap) expose getlength, which needs no bbox computation
+        if hasattr(font, 'getlength'):
+            try:
+                return int(font.getlength(text))
+            except Exception:
+                pass
+        try:
+            return self.display_manager.get_text_width(text, font)
+        except Exception:
+            # Fallback calculation
+            if hasattr(font, 'getbbox'):
+                bbox = font.getbbox(text)
+                return bbox[2] - bbox[0]
+            return len(text) * 6
+    
+    def _get_text_width(self, text: str, font) -> int:
+        """Measure text width, memoizing results per (font, text)."""
+        key = (id(font), text)
+        width = self._text_width_cache.get(key)
+        if width is not None:
+            return width
+        width = self._measure(text, font)
+        if len(self._text_width_cache) >= 4096:
+            self._text_width_cache.clear()
+        self._text_width_cache[key] = width
+        return width
+    
     def _wrap_text(self, text: str, max_width: int, font, max_lines: int = 10) -> List[str]:
         """Wrap text to fit within max_width, similar to old manager."""
         if not text:
@@ -296,15 +445,7 @@ class OfTheDayPlugin(BasePlugin):
         words = text.split()
         for word in words:
             test_line = ' '.join(current_line + [word]) if current_line else word
-            try:
-                text_width = self.display_manager.get_text_width(test_line, font)
-            except Exception:
-                # Fallback calculation
-                if isinstance(font, ImageFont.ImageFont):
-                    bbox = font.getbbox(test_line)
-                    text_width = bbox[2] - bbox[0]
-                else:
-                    text_width = len(test_line) * 6
+            text_width = self._get_text_width(test_line, font)
             if text_width <= max_width:
                 current_line.append(word)
             else:
@@ -312,22 +453,17 @@ class OfTheDayPlugin(BasePlugin):
                     lines.append(' '.join(current_line))
                     current_line = [word]
                 else:
-                    # Word is too long - truncate it
-                    truncated = word
-                    while len(truncated) > 0:
-                        try:
-                            test_width = self.display_manager.get_text_width(truncated + "...", font)
-                        except Exception:
-                            if isinstance(font, ImageFont.ImageFont):
-                                bbox = font.getbbox(truncated + "...")
-                                test_width = bbox[2] - bbox[0]
-                            else:
-                                test_width = len(truncated + "...") * 6
-                        if test_width <= max_width:
-                            lines.append(truncated + "...")
-                            break
-                        truncated = truncated[:-1]
-                    if not truncated:
+                    # Word is too long - binary search the longest prefix that fits with "..."
+                    lo, hi = 0, len(word)
+                    while lo < hi:
+                        mid = (lo + hi + 1) // 2
+                        if self._get_text_width(word[:mid] + "...", font) <= max_width:
+                            lo = mid
+                        else:
+                            hi = mid - 1
+                    if lo > 0:
+                        lines.append(word[:lo] + "...")
+                    else:
                         lines.append(word[:10] + "...")
             if len(lines) >= max_lines:
                 break
@@ -397,87 +533,34 @@ class OfTheDayPlugin(BasePlugin):
             except Exception as fallback_e:
                 self.logger.error(f"Fallback text drawing also failed: {fallback_e}", exc_info=True)
     
-    def _display_title(self, category_config: Dict, item_data: Dict):
-        """Display the title/word with subtitle, matching old manager layout."""
-        # Clear display first
-        self.display_manager.clear()
-        
-        # Use display_manager's image and draw directly
-        draw = self.display_manager.draw
-        
-        # Load fonts - match old manager font usage
-        try:
-            title_font = ImageFont.truetype('assets/fonts/PressStart2P-Regular.ttf', 8)
-        except Exception as e:
-            self.logger.warning(f"Failed to load PressStart2P font: {e}, using fallback")
-            title_font = self.display_manager.small_font if hasattr(self.display_manager, 'small_font') else ImageFont.load_default()
-        
-        try:
-            body_font = ImageFont.truetype('assets/fonts/4x6-font.ttf', 6)
-        except Exception as e:
-            self.logger.warning(f"Failed to load 4x6 font: {e}, using fallback")
-            body_font = self.display_manager.extra_small_font if hasattr(self.display_manager, 'extra_small_font') else ImageFont.load_default()
-        
-        # Get font heights
-        try:
-            title_height = self.display_manager.get_font_height(title_font)
-        except Exception as e:
-            self.logger.warning(f"Error getting title font height: {e}, using default 8")
-            title_height = 8
-        try:
-            body_height = self.display_manager.get_font_height(body_font)
-        except Exception as e:
-            self.logger.warning(f"Error getting body font height: {e}, using default 8")
-            body_height = 8
+    def _plan_title(self, item_data: Dict) -> LayoutPlan:
+        """Compute the title screen layout (title, underline, centered subtitle lines)."""
+        self._ensure_fonts()
+        title_font = self._title_font
+        body_font = self._body_font
+        title_height = self._title_height
+        body_height = self._body_height
         
         # Layout matching old manager: margin_top = 8
         margin_top = 8
         margin_bottom = 1
         underline_space = 1
         
-        # Get title/word (JSON uses "title" not "word")
-        title = item_data.get('title', item_data.get('word', 'N/A'))
-        
-        # Get subtitle (JSON uses "subtitle")
-        subtitle = item_data.get('subtitle', item_data.get('pronunciation', item_data.get('type', '')))
-        
-        # Calculate title width for centering
-        try:
-            title_width = self.display_manager.get_text_width(title, title_font)
-        except Exception as e:
-            self.logger.warning(f"Error calculating title width using display_manager: {e}, trying fallback")
-            if isinstance(title_font, ImageFont.ImageFont):
-                bbox = title_font.getbbox(title)
-                title_width = bbox[2] - bbox[0]
-            else:
-                title_width = len(title) * 6
+        title = item_data['title']
+        subtitle = item_data['subtitle']
         
         # Center the title horizontally
+        title_width = self._get_text_width(title, title_font)
         title_x = (self.display_manager.width - title_width) // 2
         title_y = margin_top
         
-        # Draw title using display_manager.draw_text (proper method)
-        self.logger.info(f"Drawing title '{title}' at ({title_x}, {title_y}) with font type {type(title_font).__name__}")
-        try:
-            self.display_manager.draw_text(
-                title,
-                x=title_x,
-                y=title_y,
-                color=self.title_color,
-                font=title_font
-            )
-            self.logger.debug(f"Title '{title}' drawn using display_manager.draw_text")
-        except Exception as e:
-            self.logger.error(f"Error drawing title '{title}': {e}", exc_info=True)
-        
-        # Draw underline below title (like old manager)
+        # Underline below title (like old manager)
         underline_y = title_y + title_height + 1
-        underline_x_start = title_x
-        underline_x_end = title_x + title_width
-        draw.line([(underline_x_start, underline_y), (underline_x_end, underline_y)], 
-                 fill=self.title_color, width=1)
         
-        # Draw subtitle below underline (centered, like old manager)
+        plan = LayoutPlan(title=title, title_x=title_x, title_y=title_y,
+                          title_width=title_width, underline_y=underline_y)
+        
+        # Subtitle below underline (centered, like old manager)
         if subtitle:
             # Wrap subtitle text if needed
             available_width = self.display_manager.width - 4
@@ -490,104 +573,43 @@ class OfTheDayPlugin(BasePlugin):
                 available_space = self.display_manager.height - underline_y - margin_bottom
                 space_after_underline = max(2, (available_space - total_subtitle_height) // 2)
                 
-                subtitle_start_y = underline_y + space_after_underline + underline_space
-                current_y = subtitle_start_y
+                current_y = underline_y + space_after_underline + underline_space
                 
                 for line in actual_subtitle_lines:
-                    if line.strip():
-                        # Center each line of subtitle
-                        try:
-                            line_width = self.display_manager.get_text_width(line, body_font)
-                        except Exception:
-                            if isinstance(body_font, ImageFont.ImageFont):
-                                bbox = body_font.getbbox(line)
-                                line_width = bbox[2] - bbox[0]
-                            else:
-                                line_width = len(line) * 6
-                        line_x = (self.display_manager.width - line_width) // 2
-                        
-                        # Use display_manager.draw_text for subtitle
-                        self.display_manager.draw_text(
-                            line,
-                            x=line_x,
-                            y=current_y,
-                            color=self.subtitle_color,
-                            font=body_font
-                        )
-                        current_y += body_height + 1
+                    # Center each line of subtitle
+                    line_width = self._get_text_width(line, body_font)
+                    line_x = (self.display_manager.width - line_width) // 2
+                    plan.lines.append((line, line_x, current_y))
+                    current_y += body_height + 1
         
-        self.display_manager.update_display()
+        return plan
     
-    def _display_content(self, category_config: Dict, item_data: Dict):
-        """Display the definition/content, matching old manager layout."""
-        # Clear display first
-        self.display_manager.clear()
-        
-        # Use display_manager's image and draw directly
-        draw = self.display_manager.draw
-        
-        # Load fonts - match old manager
-        try:
-            title_font = ImageFont.truetype('assets/fonts/PressStart2P-Regular.ttf', 8)
-        except:
-            title_font = self.display_manager.small_font if hasattr(self.display_manager, 'small_font') else ImageFont.load_default()
-        
-        try:
-            body_font = ImageFont.truetype('assets/fonts/4x6-font.ttf', 6)
-        except:
-            body_font = self.display_manager.extra_small_font if hasattr(self.display_manager, 'extra_small_font') else ImageFont.load_default()
-        
-        # Get font heights
-        try:
-            title_height = self.display_manager.get_font_height(title_font)
-        except Exception:
-            title_height = 8
-        try:
-            body_height = self.display_manager.get_font_height(body_font)
-        except Exception:
-            body_height = 8
+    def _plan_content(self, item_data: Dict) -> LayoutPlan:
+        """Compute the content screen layout (title, underline, wrapped description)."""
+        self._ensure_fonts()
+        title_font = self._title_font
+        body_font = self._body_font
+        title_height = self._title_height
+        body_height = self._body_height
         
         # Layout matching old manager: margin_top = 8
         margin_top = 8
         margin_bottom = 1
         underline_space = 1
         
-        # Get title/word (JSON uses "title")
-        title = item_data.get('title', item_data.get('word', 'N/A'))
-        self.logger.debug(f"Displaying content for title: {title}")
-        
-        # Get description (JSON uses "description")
-        description = item_data.get('description', item_data.get('definition', item_data.get('content', item_data.get('text', 'No content'))))
-        
-        # Calculate title width for centering (for underline placement)
-        try:
-            title_width = self.display_manager.get_text_width(title, title_font)
-        except Exception:
-            if isinstance(title_font, ImageFont.ImageFont):
-                bbox = title_font.getbbox(title)
-                title_width = bbox[2] - bbox[0]
-            else:
-                title_width = len(title) * 6
+        title = item_data['title']
+        description = item_data['description']
         
-        # Center the title horizontally (same position as in _display_title)
+        # Center the title horizontally (same position as in the title screen)
+        title_width = self._get_text_width(title, title_font)
         title_x = (self.display_manager.width - title_width) // 2
         title_y = margin_top
         
-        # Draw title using display_manager.draw_text (same as title screen)
-        self.display_manager.draw_text(
-            title,
-            x=title_x,
-            y=title_y,
-            color=self.title_color,
-            font=title_font
-        )
-        
-        # Draw underline below title (same as title screen)
+        # Underline below title (same as title screen)
         underline_y = title_y + title_height + 1
-        underline_x_start = title_x
-        underline_x_end = title_x + title_width
-        draw.line([(underline_x_start, underline_y), (underline_x_end, underline_y)], 
-                 fill=self.title_color, width=1)
+        
+        plan = LayoutPlan(title=title, title_x=title_x, title_y=title_y,
+                          title_width=title_width, underline_y=underline_y)
         
         # Wrap description text
         available_width = self.display_manager.width - 4
@@ -611,38 +633,77 @@ class OfTheDayPlugin(BasePlugin):
                 space_after_underline = 4
                 space_between_lines = 1
             
-            # Draw body text with dynamic spacing
-            body_start_y = underline_y + space_after_underline + underline_space + 1  # +1 to match old manager's shift
-            current_y = body_start_y
+            # Body text with dynamic spacing
+            current_y = underline_y + space_after_underline + underline_space + 1  # +1 to match old manager's shift
             
-            for i, line in enumerate(actual_body_lines):
-                if line.strip():
-                    # Center each line of body text (like old manager)
-                    try:
-                        line_width = self.display_manager.get_text_width(line, body_font)
-                    except Exception:
-                        if isinstance(body_font, ImageFont.ImageFont):
-                            bbox = body_font.getbbox(line)
-                            line_width = bbox[2] - bbox[0]
-                        else:
-                            line_width = len(line) * 6
-                    line_x = (self.display_manager.width - line_width) // 2
-                    
-                    # Use display_manager.draw_text for description
-                    self.display_manager.draw_text(
-                        line,
-                        x=line_x,
-                        y=current_y,
-                        color=self.subtitle_color,
-                        font=body_font
-                    )
-                    
-                    # Move to next line position
-                    if i < len(actual_body_lines) - 1:  # Not the last line
-                        current_y += body_height + space_between_lines
+            for line in actual_body_lines:
+                # Center each line of body text (like old manager)
+                line_width = self._get_text_width(line, body_font)
+                line_x = (self.display_manager.width - line_width) // 2
+                plan.lines.append((line, line_x, current_y))
+                current_y += body_height + space_between_lines
+        
+        return plan
+    
+    def _draw_layout(self, plan: LayoutPlan):
+        """Draw a precomputed layout to the display, reusing its rendered frame when available."""
+        if plan.frame is not None:
+            # Single blit of the already-rendered frame, then one flush
+            self.display_manager.image.paste(plan.frame)
+            self.display_manager.update_display()
+            return
+        
+        # Clear display first
+        self.display_manager.clear()
+        
+        # Draw title using display_manager.draw_text (proper method)
+        self.logger.debug(f"Drawing title '{plan.title}' at ({plan.title_x}, {plan.title_y})")
+        try:
+            self.display_manager.draw_text(
+                plan.title,
+                x=plan.title_x,
+                y=plan.title_y,
+                color=self.title_color,
+                font=self._title_font
+            )
+        except Exception as e:
+            self.logger.error(f"Error drawing title '{plan.title}': {e}", exc_info=True)
+        
+        # Draw underline below title as a 1px solid fill (paste clips to the image)
+        self.display_manager.image.paste(
+            self.title_color,
+            (plan.title_x, plan.underline_y, plan.title_x + plan.title_width + 1, plan.underline_y + 1)
+        )
+        
+        # Draw subtitle/body lines
+        for line, line_x, line_y in plan.lines:
+            self.display_manager.draw_text(
+                line,
+                x=line_x,
+                y=line_y,
+                color=self.subtitle_color,
+                font=self._body_font
+            )
         
+        plan.frame = self.display_manager.image.copy()
         self.display_manager.update_display()
     
+    def _display_title(self, category_name: str, item_data: Dict):
+        """Display the title/word with subtitle, matching old manager layout."""
+        key = (category_name, 0)
+        plan = self._layout_cache.get(key)
+        if plan is None:
+            plan = self._layout_cache[key] = self._plan_title(item_data)
+        self._draw_layout(plan)
+    
+    def _display_content(self, category_name: str, item_data: Dict):
+        """Display the definition/content, matching old manager layout."""
+        key = (category_name, 1)
+        plan = self._layout_cache.get(key)
+        if plan is None:
+            plan = self._layout_cache[key] = self._plan_content(item_data)
+        self._draw_layout(plan)
+    
     def _display_no_data(self):
         """Display message when no data is available."""
         img = Image.new('RGB', (self.display_manager.width,
@@ -707,6 +768,9 @@ class OfTheDayPlugin(BasePlugin):
         # Reset state
         self.current_category_index = 0
         self.rotation_state = 0
+        now = time.monotonic()
+        self._next_subtitle_deadline = now + self.subtitle_rotate_interval
+        self._next_category_deadline = now + self.display_rotate_interval
         self.display_needs_update = True
 
         # Reload data files (respects enabled status)
@@ -722,6 +786,7 @@ class OfTheDayPlugin(BasePlugin):
     def cleanup(self) -> None:
         """Cleanup resources."""
         self.current_items = {}
+        self._enabled_categories = ()
         self.data_files = {}
         self.logger.info("Of The Day plugin cleaned up")
 
@@ -0,0 +1,100 @@
+"""
+JSON file helpers shared by the file manager scripts.
+"""
+
+import json
+import mmap
+import os
+import re
+import tempfile
+
+# Optional fast JSON parser/serializer; falls back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files at least this large are parsed via mmap instead of read()
+MMAP_THRESHOLD = 16 * 1024
+
+# Valid day keys: 1-365 (leading zeros allowed, as int() accepted them)
+_DAY_KEY = re.compile(r'0*(?:[1-9]|[1-9]\d|[12]\d\d|3[0-5]\d|36[0-5])').fullmatch
+
+
+def read_json_file(path):
+    """Parse a JSON file, mapping large files into memory when orjson is available."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                # orjson parses straight from the mapped pages (no read() copy)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+            return orjson.loads(f.read())
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def replace_file_atomic(file_path, payload):
+    """
+    Replace file_path with payload (bytes) via a temp file + os.replace so readers never see a partial file.
+
+    The temp file is fsynced before the rename so a power cut leaves either the old or the new contents.
+    """
+    # Keep the permissions of the file being replaced; new files get the
+    # usual umask-derived mode rather than mkstemp's private 0600
+    try:
+        mode = os.stat(file_path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+
+    # Unique temp name in the same directory, so concurrent writers never share
+    # a temp file and os.replace stays a same-filesystem rename
+    directory, name = os.path.split(os.fspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory or '.', prefix=f'.{name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_json_atomic(file_path, data, raw=None):
+    """
+    Write data as indented JSON with replace_file_atomic.
+
+    If raw (already-validated JSON text) is given it is stored as-is instead of re-serializing data.
+    """
+    if raw is not None:
+        payload = raw.encode('utf-8')
+    elif orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    replace_file_atomic(file_path, payload)
+
+
+def is_day_key(key):
+    """Return True if key is a day number from 1 to 365."""
+    return _DAY_KEY(key) is not None
+
+
+def day_key_error(key):
+    """Return the validation message for a key rejected by is_day_key."""
+    try:
+        day_num = int(key)
+    except ValueError:
+        return f'Invalid key "{key}": must be a day number (1-365)'
+    if 1 <= day_num <= 365:
+        return f'Invalid key "{key}": must be a day number (1-365)'
+    return f'Day number {day_num} is out of range (must be 1-365)'
@@ -0,0 +1,18 @@
+"""
+Response output shared by the file manager scripts.
+"""
+
+import json
+import sys
+
+from _jsonio import orjson
+
+
+def emit(payload):
+    """Write a JSON response to stdout as a single line."""
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(payload) + b'\n')
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(payload))
@@ -0,0 +1,16 @@
+"""
+Filename validation shared by the file manager scripts.
+"""
+
+import re
+
+# Allow-list: one or more word characters or hyphens, then ".json". Word
+# characters match what create_file.py accepts for category names (isalnum
+# plus underscores), and the pattern rules out path separators, "..",
+# leading dots, NUL and other control characters in a single pass.
+_SAFE_FILENAME = re.compile(r'[\w-]+\.json').fullmatch
+
+
+def is_safe_filename(filename):
+    """Return True if filename is a plain data file name inside of_the_day/."""
+    return isinstance(filename, str) and _SAFE_FILENAME(filename) is not None
@@ -4,34 +4,39 @@ Create a new JSON file with template structure (365 empty entries).
 Automatically adds category to config.
 """
 
-import os
 import json
 import sys
 from pathlib import Path
 
+from _jsonio import orjson
+from _output import emit
+from update_config import add_category_to_config
+
 # Get plugin directory (scripts/ -> plugin root)
 plugin_dir = Path(__file__).parent.parent
 data_dir = plugin_dir / 'of_the_day'
-data_dir.mkdir(parents=True, exist_ok=True)
 
 try:
-    input_data = json.load(sys.stdin)
+    if orjson is not None:
+        input_data = orjson.loads(sys.stdin.buffer.read())
+    else:
+        input_data = json.load(sys.stdin)
     category_name = input_data.get('category_name', '').strip()
     display_name = input_data.get('display_name', category_name.replace('_', ' ').title() if category_name else '')
     
     if not category_name:
-        print(json.dumps({
+        emit({
             'status': 'error',
             'message': 'Category name is required'
-        }))
+        })
         sys.exit(1)
     
     # Validate category name (alphanumeric + underscores)
     if not category_name.replace('_', '').isalnum():
-        print(json.dumps({
+        emit({
             'status': 'error',
             'message': 'Category name must contain only letters, numbers, and underscores'
-        }))
+        })
         sys.exit(1)
     
     filename = f"{category_name}.json"
@@ -39,41 +44,39 @@ try:
     
     # Check if file already exists
     if file_path.exists():
-        print(json.dumps({
+        emit({
             'status': 'error',
             'message': f'File {filename} already exists'
-        }))
+        })
         sys.exit(1)
     
-    # Create template with 365 empty entries
-    template = {}
-    for day in range(1, 366):  # 1-365
-        template[str(day)] = {
-            'title': '',
-            'subtitle': '',
-            'description': ''
-        }
+    # Create template with 365 empty entries (1-365); the blank entry is
+    # never mutated before serialization, so every day can share it
+    empty_entry = {'title': '', 'subtitle': '', 'description': ''}
+    template = dict.fromkeys((str(day) for day in range(1, 366)), empty_entry)
     
     # Save file
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(template, f, indent=2, ensure_ascii=False)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        file_path.write_bytes(orjson.dumps(template, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(template, f, indent=2, ensure_ascii=False)
     
     # Update config
-    sys.path.insert(0, str(plugin_dir))
-    from scripts.update_config import add_category_to_config
     add_category_to_config(category_name, f'of_the_day/{filename}', display_name)
     
-    print(json.dumps({
+    emit({
         'status': 'success',
         'message': f'File {filename} created successfully',
         'filename': filename,
         'category_name': category_name
-    }))
+    })
     
 except Exception as e:
-    print(json.dumps({
+    emit({
         'status': 'error',
         'message': str(e)
-    }))
+    })
     sys.exit(1)
 
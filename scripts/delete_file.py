@@ -4,11 +4,14 @@ Delete a JSON file from the of_the_day directory.
 Also removes the category from plugin configuration.
 """
 
-import os
 import json
 import sys
 from pathlib import Path
 
+from _output import emit
+from _safe import is_safe_filename
+from update_config import remove_category_from_config
+
 # Get plugin directory (scripts/ -> plugin root)
 plugin_dir = Path(__file__).parent.parent
 data_dir = plugin_dir / 'of_the_day'
@@ -18,49 +21,47 @@ try:
     filename = input_data.get('filename', '')
     
     if not filename:
-        print(json.dumps({
+        emit({
             'status': 'error',
             'message': 'Filename is required'
-        }))
+        })
         sys.exit(1)
     
-    # Security: ensure filename doesn't contain path traversal
-    if '..' in filename or '/' in filename or '\\' in filename:
-        print(json.dumps({
+    # Security: allow-list plain data file names (no path traversal)
+    if not is_safe_filename(filename):
+        emit({
             'status': 'error',
             'message': 'Invalid filename'
-        }))
+        })
         sys.exit(1)
     
     file_path = data_dir / filename
     
-    if not file_path.exists():
-        print(json.dumps({
+    # Delete file (single syscall; a missing file is reported as not found)
+    try:
+        file_path.unlink()
+    except FileNotFoundError:
+        emit({
             'status': 'error',
             'message': f'File {filename} not found'
-        }))
+        })
         sys.exit(1)
     
     # Extract category name
     category_name = filename.replace('.json', '')
     
-    # Delete file
-    file_path.unlink()
-    
     # Remove from config
-    sys.path.insert(0, str(plugin_dir))
-    from scripts.update_config import remove_category_from_config
     remove_category_from_config(category_name)
     
-    print(json.dumps({
+    emit({
         'status': 'success',
         'message': f'File {filename} deleted successfully'
-    }))
+    })
     
 except Exception as e:
-    print(json.dumps({
+    emit({
         'status': 'error',
         'message': str(e)
-    }))
+    })
     sys.exit(1)
 
@@ -6,54 +6,55 @@ Get the contents of a JSON file from the of_the_day directory.
 import os
 import json
 import sys
-from pathlib import Path
 
-# Get plugin directory (scripts/ -> plugin root)
-plugin_dir = Path(__file__).parent.parent
-data_dir = plugin_dir / 'of_the_day'
+from _jsonio import read_json_file
+from _output import emit
+from _safe import is_safe_filename
+
+# Get data directory (scripts/ -> plugin root -> of_the_day), as a plain string
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'of_the_day')
 
 try:
     input_data = json.load(sys.stdin)
     filename = input_data.get('filename', '')
     
     if not filename:
-        print(json.dumps({
+        emit({
             'status': 'error',
             'message': 'Filename is required'
-        }))
+        })
         sys.exit(1)
     
-    # Security: ensure filename doesn't contain path traversal
-    if '..' in filename or '/' in filename or '\\' in filename:
-        print(json.dumps({
+    # Security: allow-list plain data file names (no path traversal)
+    if not is_safe_filename(filename):
+        emit({
             'status': 'error',
             'message': 'Invalid filename'
-        }))
+        })
         sys.exit(1)
     
-    file_path = data_dir / filename
+    file_path = os.path.join(DATA_DIR, filename)
     
-    if not file_path.exists():
-        print(json.dumps({
+    if not os.path.isfile(file_path):
+        emit({
             'status': 'error',
             'message': f'File {filename} not found'
-        }))
+        })
         sys.exit(1)
     
     # Read and return file content
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = json.load(f)
+    content = read_json_file(file_path)
     
-    print(json.dumps({
+    emit({
         'status': 'success',
         'content': content,
         'filename': filename
-    }))
+    })
     
 except Exception as e:
-    print(json.dumps({
+    emit({
         'status': 'error',
         'message': str(e)
-    }))
+    })
     sys.exit(1)
 
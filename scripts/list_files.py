@@ -7,14 +7,44 @@ Returns file metadata including entry count, size, modification time, and enable
 import os
 import json
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+
+from _jsonio import orjson, read_json_file, write_json_atomic
+from _output import emit
+from _safe import is_safe_filename
+
+# Optional streaming JSON parser, used to count entries when orjson is missing
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def count_top_level_keys(path):
+    """Count the entries of a JSON object file (0 if it is not an object)."""
+    # orjson parses the whole file faster than ijson walks its events, so
+    # stream only when the stdlib json parser would be the alternative
+    if orjson is None and ijson is not None:
+        count = 0
+        with open(path, 'rb') as f:
+            for prefix, event, _ in ijson.parse(f):
+                if prefix == '' and event == 'map_key':
+                    count += 1
+        return count
+
+    data = read_json_file(path)
+    return len(data) if isinstance(data, dict) else 0
+
 
 # Get plugin directory (scripts/ -> plugin root)
 plugin_dir = Path(__file__).parent.parent
 data_dir = plugin_dir / 'of_the_day'
 LEDMATRIX_ROOT = os.environ.get('LEDMATRIX_ROOT', os.getcwd())
 config_file = Path(LEDMATRIX_ROOT) / 'config' / 'config.json'
+# Cached entry counts: filename -> [st_mtime_ns, st_size, entry_count]
+list_cache_file = data_dir / '.list_cache.json'
 
 # Read params from stdin if provided (optional for this script)
 try:
@@ -39,49 +69,96 @@ plugin_config = config.get('of-the-day', {})
 categories_config = plugin_config.get('categories', {})
 
 if not data_dir.exists():
-    print(json.dumps({
+    emit({
         'status': 'success',
         'files': []
-    }))
+    })
     sys.exit(0)
 
-files = []
-for file_path in data_dir.glob('*.json'):
+# Load cached entry counts (ignored if missing or malformed)
+list_cache = {}
+try:
+    if list_cache_file.exists():
+        with open(list_cache_file, 'r', encoding='utf-8') as f:
+            list_cache = json.load(f)
+    if not isinstance(list_cache, dict):
+        list_cache = {}
+except (OSError, ValueError):
+    list_cache = {}
+
+
+def process_file(entry):
+    """Build the listing entry for one data file (an os.DirEntry); returns (info, cache_entry) or None."""
     try:
-        # Get file stats
-        stat = file_path.stat()
+        # Get file stats (DirEntry caches the result)
+        stat = entry.stat()
 
-        # Read and parse JSON to count entries
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            entry_count = len(data) if isinstance(data, dict) else 0
+        # Reuse the cached entry count if the file is unchanged, else parse JSON to count entries
+        cached = list_cache.get(entry.name)
+        if (isinstance(cached, list) and len(cached) == 3 and
+                cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size):
+            entry_count = cached[2]
+        else:
+            entry_count = count_top_level_keys(entry.path)
 
         # Extract category name from filename
-        category_name = file_path.stem
+        category_name = entry.name[:-len('.json')]
 
         # Get enabled status from config (default to True if not in config)
         category_config = categories_config.get(category_name, {})
         enabled = category_config.get('enabled', True)
         display_name = category_config.get('display_name', category_name.replace('_', ' ').title())
 
-        files.append({
-            'filename': file_path.name,
+        info = {
+            'filename': entry.name,
             'category_name': category_name,
             'display_name': display_name,
             'size': stat.st_size,
-            'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            'modified': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(stat.st_mtime)),
             'entry_count': entry_count,
             'enabled': enabled
-        })
-    except Exception as e:
+        }
+        return info, [stat.st_mtime_ns, stat.st_size, entry_count]
+    except Exception:
         # Skip files that can't be read
+        return None
+
+
+# Scan for data files; list only names the other actions accept (this also
+# skips hidden files such as the list cache itself)
+with os.scandir(data_dir) as it:
+    entries = [e for e in it if is_safe_filename(e.name) and e.is_file()]
+
+# Stat/read/parse files concurrently; each file is independent
+if len(entries) > 1:
+    with ThreadPoolExecutor(max_workers=min(16, len(entries))) as executor:
+        results = list(executor.map(process_file, entries))
+else:
+    results = [process_file(e) for e in entries]
+
+new_list_cache = {}
+files = []
+for result in results:
+    if result is None:
         continue
+    info, cache_entry = result
+    files.append(info)
+    new_list_cache[info['filename']] = cache_entry
+
+# Write the cache back atomically if anything changed (unique temp name, so
+# concurrent listings never write the same temp file)
+if new_list_cache != list_cache:
+    try:
+        write_json_atomic(list_cache_file, new_list_cache, raw=json.dumps(new_list_cache))
+    except OSError:
+        # Cache is best-effort; listing still succeeds
+        pass
 
 # Sort by filename
 files.sort(key=lambda x: x['filename'])
 
-print(json.dumps({
+emit({
     'status': 'success',
     'files': files
-}))
+})
 
@@ -4,84 +4,83 @@ Save updated content to a JSON file in the of_the_day directory.
 Validates the JSON structure before saving.
 """
 
-import os
 import json
 import sys
 from pathlib import Path
 
+from _jsonio import day_key_error, is_day_key, orjson, write_json_atomic
+from _output import emit
+from _safe import is_safe_filename
+
 # Get plugin directory (scripts/ -> plugin root)
 plugin_dir = Path(__file__).parent.parent
 data_dir = plugin_dir / 'of_the_day'
 
 try:
-    input_data = json.load(sys.stdin)
+    if orjson is not None:
+        input_data = orjson.loads(sys.stdin.buffer.read())
+    else:
+        input_data = json.load(sys.stdin)
     filename = input_data.get('filename', '')
     content_str = input_data.get('content', '')
     
     if not filename or not content_str:
-        print(json.dumps({
+        emit({
             'status': 'error',
             'message': 'Filename and content are required'
-        }))
+        })
         sys.exit(1)
     
-    # Security: ensure filename doesn't contain path traversal
-    if '..' in filename or '/' in filename or '\\' in filename:
-        print(json.dumps({
+    # Security: allow-list plain data file names (no path traversal)
+    if not is_safe_filename(filename):
+        emit({
             'status': 'error',
             'message': 'Invalid filename'
-        }))
+        })
         sys.exit(1)
     
     # Validate JSON
     try:
-        content = json.loads(content_str)
+        content = orjson.loads(content_str) if orjson is not None else json.loads(content_str)
     except json.JSONDecodeError as e:
-        print(json.dumps({
+        emit({
             'status': 'error',
             'message': f'Invalid JSON: {str(e)}'
-        }))
+        })
         sys.exit(1)
     
     # Validate structure
     if not isinstance(content, dict):
-        print(json.dumps({
+        emit({
             'status': 'error',
             'message': 'JSON must be an object with day numbers (1-365) as keys'
-        }))
+        })
         sys.exit(1)
     
-    # Check if keys are valid day numbers
-    for key in content.keys():
-        try:
-            day_num = int(key)
-            if day_num < 1 or day_num > 365:
-                print(json.dumps({
-                    'status': 'error',
-                    'message': f'Day number {day_num} is out of range (must be 1-365)'
-                }))
-                sys.exit(1)
-        except ValueError:
-            print(json.dumps({
-                'status': 'error',
-                'message': f'Invalid key "{key}": must be a day number (1-365)'
-            }))
-            sys.exit(1)
+    # Check if keys are valid day numbers (single compiled-regex pass)
+    bad_key = next((key for key in content if not is_day_key(key)), None)
+    if bad_key is not None:
+        emit({
+            'status': 'error',
+            'message': day_key_error(bad_key)
+        })
+        sys.exit(1)
     
     # Save file
     file_path = data_dir / filename
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(content, f, indent=2, ensure_ascii=False)
+    # Already-formatted (multi-line) input is stored verbatim rather than
+    # serialized a second time; compact input is re-emitted indented
+    write_json_atomic(file_path, content, raw=content_str if '\n' in content_str else None)
     
-    print(json.dumps({
+    emit({
         'status': 'success',
         'message': f'File {filename} saved successfully'
-    }))
+    })
     
 except Exception as e:
-    print(json.dumps({
+    emit({
         'status': 'error',
         'message': str(e)
-    }))
+    })
     sys.exit(1)
 
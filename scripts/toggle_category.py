@@ -9,6 +9,8 @@ import json
 import sys
 from pathlib import Path
 
+from _output import emit
+
 LEDMATRIX_ROOT = os.environ.get('LEDMATRIX_ROOT', os.getcwd())
 config_file = Path(LEDMATRIX_ROOT) / 'config' / 'config.json'
 
@@ -20,18 +22,18 @@ try:
     else:
         params = {}
 except (json.JSONDecodeError, ValueError) as e:
-    print(json.dumps({
+    emit({
         'status': 'error',
         'message': f'Invalid JSON input: {str(e)}'
-    }))
+    })
     sys.exit(1)
 
 category_name = params.get('category_name')
 if not category_name:
-    print(json.dumps({
+    emit({
         'status': 'error',
         'message': 'category_name is required'
-    }))
+    })
     sys.exit(1)
 
 # Load current config
@@ -41,35 +43,33 @@ try:
         with open(config_file, 'r', encoding='utf-8') as f:
             config = json.load(f)
 except (json.JSONDecodeError, ValueError) as e:
-    print(json.dumps({
+    emit({
         'status': 'error',
         'message': f'Failed to load config: {str(e)}'
-    }))
+    })
     sys.exit(1)
 
 # Get plugin config
 plugin_config = config.get('of-the-day', {})
 categories = plugin_config.get('categories', {})
 
-# Check if category exists
-if category_name not in categories:
-    print(json.dumps({
+# Look up the category once
+category_config = categories.get(category_name)
+if category_config is None:
+    emit({
         'status': 'error',
         'message': f'Category "{category_name}" not found in config'
-    }))
+    })
     sys.exit(1)
 
-# Determine new enabled state
+# Determine new enabled state: explicit state if provided, else toggle current state
 if 'enabled' in params:
-    # Explicit state provided
     new_enabled = bool(params['enabled'])
 else:
-    # Toggle current state
-    current_enabled = categories[category_name].get('enabled', True)
-    new_enabled = not current_enabled
+    new_enabled = not category_config.get('enabled', True)
 
-# Update the category
-categories[category_name]['enabled'] = new_enabled
+# Update the category (in place; categories/plugin_config are the loaded dicts)
+category_config['enabled'] = new_enabled
 plugin_config['categories'] = categories
 config['of-the-day'] = plugin_config
 
@@ -79,15 +79,15 @@ try:
     with open(config_file, 'w', encoding='utf-8') as f:
         json.dump(config, f, indent=2, ensure_ascii=False)
 except Exception as e:
-    print(json.dumps({
+    emit({
         'status': 'error',
         'message': f'Failed to save config: {str(e)}'
-    }))
+    })
     sys.exit(1)
 
-print(json.dumps({
+emit({
     'status': 'success',
     'message': f'Category "{category_name}" {"enabled" if new_enabled else "disabled"}',
     'category_name': category_name,
     'enabled': new_enabled
-}))
+})
@@ -6,75 +6,124 @@ Adds or removes categories from the plugin config.
 
 import os
 import json
+from contextlib import contextmanager
 from pathlib import Path
 
+from _jsonio import replace_file_atomic
+
 LEDMATRIX_ROOT = os.environ.get('LEDMATRIX_ROOT', os.getcwd())
 config_file = Path(LEDMATRIX_ROOT) / 'config' / 'config.json'
 
+# In-process cache of the parsed config, valid while config.json's mtime is unchanged
+_cache = {'mtime_ns': None, 'config': None}
+
+def _invalidate_cache():
+    """Forget the cached config so the next load re-reads the file."""
+    _cache['mtime_ns'] = None
+    _cache['config'] = None
+
 def load_config():
-    """Load the main configuration file."""
-    if not config_file.exists():
+    """Load the main configuration file (cached until its mtime changes)."""
+    try:
+        mtime_ns = config_file.stat().st_mtime_ns
+    except FileNotFoundError:
         return {}
     
+    if _cache['config'] is not None and _cache['mtime_ns'] == mtime_ns:
+        return _cache['config']
+    
     with open(config_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+        config = json.load(f)
+    
+    _cache['mtime_ns'] = mtime_ns
+    _cache['config'] = config
+    return config
 
 def save_config(config):
-    """Save the configuration file."""
+    """Save the configuration file atomically (temp file, fsync, rename)."""
     config_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(config_file, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+    try:
+        replace_file_atomic(config_file, json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8'))
+    except BaseException:
+        _invalidate_cache()
+        raise
+    
+    _cache['mtime_ns'] = config_file.stat().st_mtime_ns
+    _cache['config'] = config
+
+@contextmanager
+def config_transaction(config=None):
+    """
+    Load the config once, let the caller apply any number of mutations, then write it once.
+
+    A config the caller already got from load_config() may be passed in so a
+    check made on it and the mutations below act on the same data.
+    """
+    if config is None:
+        config = load_config()
+    try:
+        yield config
+    except BaseException:
+        # Mutations may have been applied to the cached dict; drop it
+        _invalidate_cache()
+        raise
+    save_config(config)
 
 def add_category_to_config(category_name, data_file, display_name):
     """Add a category to the plugin configuration."""
-    config = load_config()
-    
-    # Get plugin config or create it
-    plugin_config = config.get('of-the-day', {})
-    
-    # Get categories or create it
-    categories = plugin_config.get('categories', {})
-    
-    # Add category
-    categories[category_name] = {
+    category_config = {
         'enabled': True,
         'data_file': data_file,
         'display_name': display_name
     }
     
-    plugin_config['categories'] = categories
-    
-    # Add to category_order if not present
-    category_order = plugin_config.get('category_order', [])
-    if category_name not in category_order:
-        category_order.append(category_name)
-    plugin_config['category_order'] = category_order
+    # Skip the rewrite if the category is already configured exactly like this
+    plugin_config = load_config().get('of-the-day', {})
+    if (plugin_config.get('categories', {}).get(category_name) == category_config and
+            category_name in plugin_config.get('category_order', [])):
+        return
     
-    # Save back to config
-    config['of-the-day'] = plugin_config
-    save_config(config)
+    with config_transaction() as config:
+        # Get plugin config or create it
+        plugin_config = config.get('of-the-day', {})
+        
+        # Get categories or create it
+        categories = plugin_config.get('categories', {})
+        
+        # Add category
+        categories[category_name] = category_config
+        
+        plugin_config['categories'] = categories
+        
+        # Add to category_order if not present
+        category_order = plugin_config.get('category_order', [])
+        if category_name not in category_order:
+            category_order.append(category_name)
+        plugin_config['category_order'] = category_order
+        
+        config['of-the-day'] = plugin_config
 
 def remove_category_from_config(category_name):
     """Remove a category from the plugin configuration."""
+    # Nothing to remove: skip the rewrite. The transaction reuses this same
+    # config, so the check and the removal below always see the same data
     config = load_config()
-    
     plugin_config = config.get('of-the-day', {})
-    if not plugin_config:
+    if (category_name not in plugin_config.get('categories', {}) and
+            category_name not in plugin_config.get('category_order', [])):
         return
     
-    # Remove from categories
-    categories = plugin_config.get('categories', {})
-    if category_name in categories:
-        del categories[category_name]
-    plugin_config['categories'] = categories
-    
-    # Remove from category_order
-    category_order = plugin_config.get('category_order', [])
-    if category_name in category_order:
-        category_order.remove(category_name)
-    plugin_config['category_order'] = category_order
-    
-    # Save back to config
-    config['of-the-day'] = plugin_config
-    save_config(config)
-
+    with config_transaction(config) as config:
+        plugin_config = config.get('of-the-day', {})
+        
+        # Remove from categories
+        categories = plugin_config.get('categories', {})
+        if category_name in categories:
+            del categories[category_name]
+        plugin_config['categories'] = categories
+        
+        # Remove from category_order
+        category_order = plugin_config.get('category_order', [])
+        if category_name in category_order:
+            category_order.remove(category_name)
+        plugin_config['category_order'] = category_order
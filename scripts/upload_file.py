@@ -4,11 +4,15 @@ Upload a JSON file to the of_the_day directory.
 Validates the file format and automatically adds category to config.
 """
 
-import os
 import json
 import sys
 from pathlib import Path
 
+from _jsonio import day_key_error, is_day_key, orjson, write_json_atomic
+from _output import emit
+from _safe import is_safe_filename
+from update_config import add_category_to_config
+
 # Get plugin directory (scripts/ -> plugin root)
 plugin_dir = Path(__file__).parent.parent
 data_dir = plugin_dir / 'of_the_day'
@@ -16,85 +20,87 @@ data_dir.mkdir(parents=True, exist_ok=True)
 
 # Read JSON from stdin
 try:
-    input_data = json.load(sys.stdin)
+    if orjson is not None:
+        input_data = orjson.loads(sys.stdin.buffer.read())
+    else:
+        input_data = json.load(sys.stdin)
     filename = input_data.get('filename', '')
     content = input_data.get('content', '')
     
     if not filename or not content:
-        print(json.dumps({
+        emit({
             'status': 'error',
             'message': 'Filename and content are required'
-        }))
+        })
         sys.exit(1)
     
     # Validate filename
     if not filename.endswith('.json'):
-        print(json.dumps({
+        emit({
             'status': 'error',
             'message': 'File must be a JSON file (.json)'
-        }))
+        })
+        sys.exit(1)
+    
+    # Security: allow-list plain data file names (no path traversal)
+    if not is_safe_filename(filename):
+        emit({
+            'status': 'error',
+            'message': 'Invalid filename'
+        })
         sys.exit(1)
     
     # Validate JSON content
     try:
-        data = json.loads(content)
+        data = orjson.loads(content) if orjson is not None else json.loads(content)
     except json.JSONDecodeError as e:
-        print(json.dumps({
+        emit({
             'status': 'error',
             'message': f'Invalid JSON: {str(e)}'
-        }))
+        })
         sys.exit(1)
     
     # Validate structure (should be object with day number keys)
     if not isinstance(data, dict):
-        print(json.dumps({
+        emit({
             'status': 'error',
             'message': 'JSON must be an object with day numbers (1-365) as keys'
-        }))
+        })
         sys.exit(1)
     
-    # Check if keys are valid day numbers
-    for key in data.keys():
-        try:
-            day_num = int(key)
-            if day_num < 1 or day_num > 365:
-                print(json.dumps({
-                    'status': 'error',
-                    'message': f'Day number {day_num} is out of range (must be 1-365)'
-                }))
-                sys.exit(1)
-        except ValueError:
-            print(json.dumps({
-                'status': 'error',
-                'message': f'Invalid key "{key}": must be a day number (1-365)'
-            }))
-            sys.exit(1)
+    # Check if keys are valid day numbers (single compiled-regex pass)
+    bad_key = next((key for key in data if not is_day_key(key)), None)
+    if bad_key is not None:
+        emit({
+            'status': 'error',
+            'message': day_key_error(bad_key)
+        })
+        sys.exit(1)
     
     # Save file
     file_path = data_dir / filename
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Already-formatted (multi-line) input is stored verbatim rather than
+    # serialized a second time; compact input is re-emitted indented
+    write_json_atomic(file_path, data, raw=content if '\n' in content else None)
     
     # Extract category name and update config
     category_name = filename.replace('.json', '')
     display_name = input_data.get('display_name', category_name.replace('_', ' ').title())
     
     # Update config
-    sys.path.insert(0, str(plugin_dir))
-    from scripts.update_config import add_category_to_config
     add_category_to_config(category_name, f'of_the_day/{filename}', display_name)
     
-    print(json.dumps({
+    emit({
         'status': 'success',
         'message': f'File {filename} uploaded successfully',
         'filename': filename,
         'category_name': category_name
-    }))
+    })
     
 except Exception as e:
-    print(json.dumps({
+    emit({
         'status': 'error',
         'message': str(e)
-    }))
+    })
     sys.exit(1)
 